@@ -52,8 +52,9 @@ Directory Structure:
 # Author: Canstralian
 # Usage: ./cli.sh <script> [args]
 
-SCRIPTS_DIR="$(dirname "$0")/scripts"
-LOG_FILE="$(dirname "$0")/cli_error.log"
+CLI_DIR="$(dirname "$0")"
+SCRIPTS_DIR="$CLI_DIR/scripts"
+LOG_FILE="$CLI_DIR/cli_error.log"
 
 set -euo pipefail
 
@@ -102,6 +103,7 @@ hash_arg() {
 }
 
 menu() {
+	local rc
 	while true; do
 		ascii_art
 		echo
@@ -135,13 +137,15 @@ menu() {
 				set -- $args
 				hashed_first_arg=$(hash_arg "$1")
 				"$SCRIPT" "$hashed_first_arg" "${@:2}" || {
-					log_error "Script '$choice' exited with error code $? (menu mode)"
-					echo "[ERROR] Script '$choice' exited with error code $?"
+					rc=$?
+					log_error "Script '$choice' exited with error code $rc (menu mode)"
+					echo "[ERROR] Script '$choice' exited with error code $rc"
 				}
 			else
 				"$SCRIPT" || {
-					log_error "Script '$choice' exited with error code $? (menu mode)"
-					echo "[ERROR] Script '$choice' exited with error code $?"
+					rc=$?
+					log_error "Script '$choice' exited with error code $rc (menu mode)"
+					echo "[ERROR] Script '$choice' exited with error code $rc"
 				}
 			fi
 		else
@@ -93,6 +93,12 @@ PARROT_CRON_HEALTH="${PARROT_CRON_HEALTH:-0 * * * *}"
 
 # Initialize log directory
 parrot_init_log_dir() {
+    # parrot_log calls this for every message; skip the mkdir/chmod once
+    # the current log directory has been set up under the current perms mode
+    if [ "${_PARROT_LOG_DIR_READY:-}" = "$PARROT_LOG_DIR:$PARROT_STRICT_PERMS" ] && [ -d "$PARROT_LOG_DIR" ]; then
+        return 0
+    fi
+
     if [ ! -d "$PARROT_LOG_DIR" ]; then
         mkdir -p "$PARROT_LOG_DIR" || {
             echo "ERROR: Failed to create log directory: $PARROT_LOG_DIR" >&2
@@ -103,6 +109,8 @@ parrot_init_log_dir() {
     if [ "$PARROT_STRICT_PERMS" = "true" ]; then
         chmod 700 "$PARROT_LOG_DIR" 2>/dev/null || true
     fi
+
+    _PARROT_LOG_DIR_READY="$PARROT_LOG_DIR:$PARROT_STRICT_PERMS"
 }
 
 # Structured logging function
@@ -112,10 +120,7 @@ parrot_log() {
     shift
     local message="$*"
     local log_file="${PARROT_CURRENT_LOG:-$PARROT_SERVER_LOG}"
-    local msgid
-
-    # Generate unique message ID using nanosecond timestamp
-    msgid="$(date +%s%N)"
+    local now msgid timestamp
 
     # Ensure log directory exists
     parrot_init_log_dir
@@ -125,10 +130,10 @@ parrot_log() {
     case "$PARROT_LOG_LEVEL" in
         DEBUG) should_log=true ;;
         INFO)
-            [[ "$level" =~ ^(INFO|WARN|ERROR)$ ]] && should_log=true
+            case "$level" in INFO | WARN | ERROR) should_log=true ;; esac
             ;;
         WARN)
-            [[ "$level" =~ ^(WARN|ERROR)$ ]] && should_log=true
+            case "$level" in WARN | ERROR) should_log=true ;; esac
             ;;
         ERROR)
             [[ "$level" = "ERROR" ]] && should_log=true
@@ -136,7 +141,12 @@ parrot_log() {
     esac
 
     if [ "$should_log" = "true" ]; then
-        echo "[$(date '+%Y-%m-%d %H:%M:%S')] [$level] [msgid:$msgid] $message" >> "$log_file"
+        # One date call gives both the unique message ID (nanosecond
+        # timestamp) and the human-readable time
+        now="$(date '+%s%N %Y-%m-%d %H:%M:%S')"
+        msgid="${now%% *}"
+        timestamp="${now#* }"
+        echo "[$timestamp] [$level] [msgid:$msgid] $message" >> "$log_file"
     fi
 
     # Also output to stderr for ERROR level
@@ -387,9 +397,9 @@ parrot_check_rate_limit() {
         return 1
     fi
     
-    # Sanitize inputs to prevent injection
-    user=$(echo "$user" | tr -cd '[:alnum:]_-')
-    operation=$(echo "$operation" | tr -cd '[:alnum:]_-')
+    # Sanitize inputs to prevent injection (parameter expansion, no subshells)
+    user="${user//[^a-zA-Z0-9_-]/}"
+    operation="${operation//[^a-zA-Z0-9_-]/}"
     
     # Ensure rate limit file exists
     if [ ! -f "$PARROT_RATE_LIMIT_FILE" ]; then
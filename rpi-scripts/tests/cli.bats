@@ -0,0 +1,26 @@
+#!/usr/bin/env bats
+# cli.bats - Tests for cli.sh
+
+setup() {
+    # Run a copy of cli.sh against a scripts directory we control
+    TEST_DIR="$(mktemp -d)"
+    export TEST_DIR
+    cp "$BATS_TEST_DIRNAME/../cli.sh" "$TEST_DIR/cli.sh"
+    mkdir -p "$TEST_DIR/scripts"
+    printf '#!/usr/bin/env bash\nexit 7\n' > "$TEST_DIR/scripts/fail.sh"
+    chmod +x "$TEST_DIR/scripts/fail.sh"
+}
+
+teardown() {
+    if [ -n "${TEST_DIR:-}" ] && [ -d "$TEST_DIR" ]; then
+        rm -rf "$TEST_DIR"
+    fi
+}
+
+@test "cli menu: reports the failing script's exit code" {
+    # Select "fail" with no arguments, dismiss the pause prompt, then quit
+    run bash -c 'source "$0"; menu' "$TEST_DIR/cli.sh" <<< $'fail\n\n\nq'
+    [ "$status" -eq 0 ]
+    [[ "$output" == *"[ERROR] Script 'fail' exited with error code 7"* ]]
+    grep -q "Script 'fail' exited with error code 7 (menu mode)" "$TEST_DIR/cli_error.log"
+}
@@ -327,8 +327,9 @@ teardown() {
 }
 
 @test "parrot_validate_json: rejects file exceeding max size" {
-    # Create file larger than default max size (1MB)
-    dd if=/dev/zero of="$TEST_DIR/large.json" bs=1M count=2 2>/dev/null
+    # Create file larger than default max size (1MB); only the size is
+    # checked, so a sparse file avoids writing 2MB of zeros to disk
+    dd if=/dev/zero of="$TEST_DIR/large.json" bs=1024 count=0 seek=2048 2>/dev/null
     run parrot_validate_json "$TEST_DIR/large.json"
     [ "$status" -eq 1 ]
 }
@@ -337,6 +338,37 @@ teardown() {
 # LOGGING TESTS
 # ============================================================================
 
+@test "parrot_init_log_dir: re-initializes when log directory changes" {
+    export PARROT_LOG_DIR="$TEST_DIR/first"
+    parrot_init_log_dir
+    export PARROT_LOG_DIR="$TEST_DIR/second"
+    parrot_init_log_dir
+    [ -d "$TEST_DIR/second" ]
+}
+
+@test "parrot_init_log_dir: recreates log directory after removal" {
+    export PARROT_LOG_DIR="$TEST_DIR/logs"
+    parrot_init_log_dir
+    rm -rf "$TEST_DIR/logs"
+    parrot_init_log_dir
+    [ -d "$TEST_DIR/logs" ]
+}
+
+@test "parrot_init_log_dir: applies permissions when strict mode is enabled later" {
+    export PARROT_LOG_DIR="$TEST_DIR/logs"
+    mkdir -p "$PARROT_LOG_DIR"
+    chmod 755 "$PARROT_LOG_DIR"
+    export PARROT_STRICT_PERMS="false"
+    parrot_init_log_dir
+    perms=$(stat -c "%a" "$PARROT_LOG_DIR" 2>/dev/null || stat -f "%Lp" "$PARROT_LOG_DIR" 2>/dev/null)
+    [ "$perms" = "755" ]
+
+    export PARROT_STRICT_PERMS="true"
+    parrot_init_log_dir
+    perms=$(stat -c "%a" "$PARROT_LOG_DIR" 2>/dev/null || stat -f "%Lp" "$PARROT_LOG_DIR" 2>/dev/null)
+    [ "$perms" = "700" ]
+}
+
 @test "parrot_log: creates log entry" {
     export PARROT_LOG_DIR="$TEST_DIR"
     export PARROT_SERVER_LOG="$TEST_DIR/test.log"
@@ -1,12 +1,8 @@
 #!/usr/bin/env bats
 # health_check.bats - Tests for health_check.sh script
 
-# Setup test environment
-setup() {
-    # Store original directory
-    ORIG_DIR="$(pwd)"
-
-    # Find the script directory
+# Find the script directory once per file rather than in every test
+setup_file() {
     if [ -f "scripts/health_check.sh" ]; then
         SCRIPT_DIR="$(pwd)"
     elif [ -f "../scripts/health_check.sh" ]; then
@@ -17,6 +13,13 @@ setup() {
         echo "# Cannot find health_check.sh" >&2
         return 1
     fi
+    export SCRIPT_DIR
+}
+
+# Setup test environment
+setup() {
+    # Store original directory
+    ORIG_DIR="$(pwd)"
 
     # Create temporary test directory
     TEST_DIR="$(mktemp -d)"
@@ -152,16 +155,14 @@ teardown() {
     # Don't create workflow log file
     run bash scripts/health_check.sh
     # Script should still complete but log warning
-    grep -q "Workflow log file not found" "$TEST_DIR/logs/health_check.log" || \
-    grep -q "ALERT.*workflow" "$TEST_DIR/logs/health_check.log"
+    grep -q -e "Workflow log file not found" -e "ALERT.*workflow" "$TEST_DIR/logs/health_check.log"
 }
 
 @test "health_check: handles empty workflow log" {
     # Create empty workflow log
     touch "$TEST_DIR/logs/daily_workflow.log"
     run bash scripts/health_check.sh
-    grep -q "empty" "$TEST_DIR/logs/health_check.log" || \
-    grep -q "not found" "$TEST_DIR/logs/health_check.log"
+    grep -q -e "empty" -e "not found" "$TEST_DIR/logs/health_check.log"
 }
 
 @test "health_check: accepts recent workflow log entry" {
@@ -240,13 +241,13 @@ teardown() {
 @test "health_check: runs all checks" {
     run bash scripts/health_check.sh
     [ "$status" -eq 0 ]
-    log_content=$(cat "$TEST_DIR/logs/health_check.log")
+    log_content=$(<"$TEST_DIR/logs/health_check.log")
 
     # Verify all checks were performed
-    echo "$log_content" | grep -q "Starting health check"
-    echo "$log_content" | grep -q "Disk usage:"
-    echo "$log_content" | grep -q "System load:"
-    echo "$log_content" | grep -q "MCP server"
+    [[ "$log_content" == *"Starting health check"* ]]
+    [[ "$log_content" == *"Disk usage:"* ]]
+    [[ "$log_content" == *"System load:"* ]]
+    [[ "$log_content" == *"MCP server"* ]]
 }
 
 @test "health_check: exit code reflects overall status" {
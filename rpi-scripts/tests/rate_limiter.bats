@@ -149,6 +149,23 @@ teardown() {
     [ "$output" -eq 1 ]
 }
 
+@test "rate limiter: strips non-ASCII characters from inputs" {
+    run parrot_check_rate_limit "üser" "scän"
+    [ "$status" -eq 0 ]
+
+    run grep -c "^ser:scn:" "$PARROT_RATE_LIMIT_FILE"
+    [ "$output" -eq 1 ]
+}
+
+@test "rate limiter: records option-like inputs verbatim" {
+    # Values such as -n or -e must not be interpreted as echo flags
+    run parrot_check_rate_limit "-n" "-e"
+    [ "$status" -eq 0 ]
+
+    run grep -c -- "^-n:-e:" "$PARROT_RATE_LIMIT_FILE"
+    [ "$output" -eq 1 ]
+}
+
 @test "rate limiter: requires both user and operation parameters" {
     # Missing operation
     run parrot_check_rate_limit "user1" ""